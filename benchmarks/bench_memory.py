@@ -0,0 +1,106 @@
+"""
+Peak memory per concurrent scrape of a large event stats table.
+
+Serves a synthetic stats page from a local HTTP server and extracts the
+player rows with K concurrent scrapes, once by building a full
+BeautifulSoup tree and once by streaming the body through StatsTableParser.
+
+    python benchmarks/bench_memory.py --rows 2000 --concurrency 4
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vlr_scraper import StatsTableParser, VLRScraper
+
+
+def build_stats_page(rows):
+    stat_cells = ''.join(f'<td class="mod-color-sq"><div class="color-sq"><span>{n}.{n}</span></div></td>' for n in range(15))
+    body = ''.join(
+        '<tr>'
+        f'<td class="mod-player mod-a"><a href="/player/{i}/player{i}">'
+        f'<div class="text-of" style="max-width: 85px; font-weight: 700;">Player{i}</div>'
+        '<div class="stats-player-country">TEAM</div></a></td>'
+        '<td class="mod-agents"><div><img src="/img/vlr/game/agents/jett.png" title="jett"></div></td>'
+        f'{stat_cells}</tr>'
+        for i in range(rows)
+    )
+    return f'<html><body><table class="wf-table mod-stats"><tbody>{body}</tbody></table></body></html>'.encode()
+
+
+def serve(page):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(page)))
+            self.end_headers()
+            self.wfile.write(page)
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def extract_with_tree(scraper, url):
+    soup = scraper.get_page(url)
+    players = []
+    for row in soup.find_all('tr'):
+        player_cell = row.find('td', class_='mod-player mod-a')
+        if not player_cell:
+            continue
+        player_link = player_cell.find('a')
+        href = player_link.get('href') if player_link else None
+        if href and '/player/' in href:
+            name_div = player_link.find('div', style=lambda x: x and 'font-weight: 700' in x)
+            if name_div:
+                players.append({"id": href.split('/player/')[1].split('/')[0], "name": name_div.text.strip()})
+    return players
+
+
+def extract_streaming(scraper, url):
+    return list(scraper.stream_page(url, StatsTableParser()))
+
+
+def measure(extract, url, concurrency):
+    scrapers = [VLRScraper() for _ in range(concurrency)]
+    tracemalloc.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        counts = list(executor.map(lambda s: len(extract(s, url)), scrapers))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return counts[0], peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=4)
+    args = parser.parse_args()
+
+    page = build_stats_page(args.rows)
+    server = serve(page)
+    url = f"http://127.0.0.1:{server.server_address[1]}/event/stats"
+    print(f"page size: {len(page) / 1024:.0f} KiB, rows: {args.rows}, concurrency: {args.concurrency}")
+
+    for label, extract in (('tree', extract_with_tree), ('streaming', extract_streaming)):
+        rows, peak, elapsed = measure(extract, url, args.concurrency)
+        print(f"{label:>10}: {rows} rows, peak {peak / 2**20:.1f} MiB total, "
+              f"{peak / args.concurrency / 2**20:.1f} MiB per scrape, {elapsed:.2f}s")
+
+    server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Cold start measurements for the API.
+
+Reports the import time of main, the time from process spawn until the
+first request is served (/health) and until the instance is ready (/ready),
+and the latency of the first and second request to a real endpoint.
+
+    python benchmarks/bench_startup.py --path /player/9
+    VLR_WARM_CONNECTIONS=0 python benchmarks/bench_startup.py --path /player/9
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_time(module, repeats):
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    samples = [
+        float(subprocess.check_output([sys.executable, '-c', code], cwd=ROOT, text=True))
+        for _ in range(repeats)
+    ]
+    return statistics.median(samples)
+
+
+def request(url, timeout=30):
+    """Return (status, seconds, body) for a GET request"""
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            body = response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        body = e.read()
+        status = e.code
+    return status, time.perf_counter() - start, body.decode(errors='replace')
+
+
+def wait_for(url, started, deadline=60):
+    """Poll url until it answers 200, return seconds since started"""
+    while time.perf_counter() - started < deadline:
+        try:
+            status, _, body = request(url, timeout=1)
+            if status == 200:
+                return time.perf_counter() - started
+            if "failed" in body:
+                raise RuntimeError(f"{url}: {body}")
+        except (urllib.error.URLError, ConnectionError, socket.timeout):
+            pass
+        time.sleep(0.01)
+    raise TimeoutError(f"{url} not ready after {deadline}s")
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--path', default="/player/9", help="endpoint used for first-request latency")
+    parser.add_argument('--repeats', type=int, default=5, help="import time samples")
+    args = parser.parse_args()
+
+    print(f"import vlr_scraper: {import_time('vlr_scraper', args.repeats) * 1000:.1f} ms")
+    print(f"import main:        {import_time('main', args.repeats) * 1000:.1f} ms")
+
+    port = free_port()
+    base = f"http://127.0.0.1:{port}"
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'main:app', '--port', str(port), '--log-level', 'warning'],
+        cwd=ROOT
+    )
+    try:
+        print(f"time to first request (/health): {wait_for(base + '/health', started):.3f} s")
+        print(f"time to ready (/ready):          {wait_for(base + '/ready', started):.3f} s")
+        for label in ('first', 'second'):
+            status, seconds, _ = request(base + args.path)
+            print(f"{label} request {args.path}: {seconds * 1000:.1f} ms (HTTP {status})")
+    finally:
+        server.terminate()
+        server.wait()
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,44 @@
+import asyncio
+import os
+import time
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException
 from vlr_scraper import VLRScraper
 
+# Initialize the scraper (cheap: heavy imports and connections are deferred to warm-up)
+scraper = VLRScraper(base_url=os.environ.get("VLR_BASE_URL", "https://www.vlr.gg"))
+
+# Number of keep-alive connections to vlr.gg attempted before reporting ready (0 disables)
+WARM_CONNECTIONS = int(os.environ.get("VLR_WARM_CONNECTIONS", "4"))
+
+warmup_status = {"ready": False, "seconds": None, "error": None, "connections": 0}
+
+def warm_up():
+    """Load the player index and open pooled connections ahead of traffic"""
+    start = time.perf_counter()
+    try:
+        warmup_status["connections"] = scraper.warm_up(connections=WARM_CONNECTIONS)
+        warmup_status["ready"] = True
+    except Exception as e:
+        warmup_status["error"] = str(e)
+        print(f"Warm-up failed: {e}")
+    warmup_status["seconds"] = round(time.perf_counter() - start, 3)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Warm up in the background so /health answers immediately while /ready waits
+    warmup_task = asyncio.create_task(asyncio.to_thread(warm_up))
+    yield
+    await warmup_task
+
 app = FastAPI(
     title="VLR API",
     description="API for scraping VLR.gg data including players, teams, and matches",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
-# Initialize the scraper
-scraper = VLRScraper()
-
 @app.get("/")
 def read_root():
     return {"message": "VLR API - Valorant data from vlr.gg"}
@@ -125,6 +154,23 @@ def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "message": "VLR API is running"}
 
+@app.get("/ready")
+def readiness_check():
+    """
+    Readiness endpoint, succeeds once the player index is loaded and the
+    connection warm-up has run. Connection warm-up is best-effort: the
+    number of connections actually opened is reported, not required.
+    """
+    if not warmup_status["ready"]:
+        detail = f"Warm-up failed: {warmup_status['error']}" if warmup_status["error"] else "Warming up"
+        raise HTTPException(status_code=503, detail=detail)
+    
+    return {
+        "status": "ready",
+        "warmup_seconds": warmup_status["seconds"],
+        "warm_connections": warmup_status["connections"]
+    }
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
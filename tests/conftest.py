@@ -0,0 +1,56 @@
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FixtureServer:
+    """
+    Local HTTP server for scraper tests.
+    routes maps a request path to a (status, body) tuple, or to a list of
+    them that is served in order, repeating the last one. An optional third
+    element overrides Content-Length to simulate a connection cut mid-body.
+    """
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        self.content_type = 'text/html; charset=utf-8'
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server.requests.append(self.path)
+                route = server.routes.get(self.path, (404, ''))
+                if isinstance(route, list):
+                    route = route.pop(0) if len(route) > 1 else route[0]
+                status, body = route[:2]
+                body = body.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', server.content_type)
+                self.send_header('Content-Length', str(route[2] if len(route) > 2 else len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_HEAD(self):
+                server.requests.append(f"HEAD {self.path}")
+                self.send_response(200)
+                self.end_headers()
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+
+@pytest.fixture
+def fixture_server():
+    server = FixtureServer()
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
@@ -0,0 +1,67 @@
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+import main
+import vlr_scraper
+from vlr_scraper import VLRScraper
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def imported_modules(module):
+    code = f"import sys, {module}; print('requests' in sys.modules, 'bs4' in sys.modules)"
+    return subprocess.check_output([sys.executable, '-c', code], cwd=ROOT, text=True).split()
+
+
+def test_import_defers_requests_and_bs4():
+    assert imported_modules('vlr_scraper') == ['False', 'False']
+    assert imported_modules('main') == ['False', 'False']
+
+
+def test_warm_up_loads_index_and_opens_connections(fixture_server, tmp_path, monkeypatch):
+    index = tmp_path / "index.csv"
+    index.write_text('Player ID,Player Name\r\n1,a\r\n', encoding='utf-8')
+    monkeypatch.setattr(vlr_scraper, 'PLAYER_INDEX_PATH', str(index))
+    scraper = VLRScraper(base_url=fixture_server.url)
+
+    assert scraper.warm_up(connections=3) == 3
+
+    assert scraper._player_index.get_string(1) == 'a'
+    assert fixture_server.requests.count("HEAD /") == 3
+    assert 'bs4' in sys.modules
+
+
+def test_warm_up_connections_are_best_effort(tmp_path, monkeypatch):
+    monkeypatch.setattr(vlr_scraper, 'PLAYER_INDEX_PATH', str(tmp_path / "index.csv"))
+    scraper = VLRScraper(base_url="http://127.0.0.1:9")
+
+    assert scraper.warm_up(connections=2) == 0
+
+
+def test_ready_reports_503_until_warm_up_finishes(monkeypatch):
+    release = threading.Event()
+
+    class SlowScraper:
+        def warm_up(self, connections):
+            release.wait(5)
+            return connections
+
+    monkeypatch.setattr(main, 'scraper', SlowScraper())
+    monkeypatch.setattr(main, 'WARM_CONNECTIONS', 2)
+    monkeypatch.setattr(main, 'warmup_status', {"ready": False, "seconds": None, "error": None, "connections": 0})
+
+    worker = threading.Thread(target=main.warm_up)
+    worker.start()
+    with pytest.raises(main.HTTPException) as error:
+        main.readiness_check()
+    assert error.value.status_code == 503
+    release.set()
+    worker.join()
+
+    response = main.readiness_check()
+    assert response["status"] == "ready"
+    assert response["warm_connections"] == 2
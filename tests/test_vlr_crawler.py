@@ -0,0 +1,83 @@
+import json
+
+from vlr_crawler import MatchCrawler
+from vlr_scraper import VLRScraper
+
+MATCH_PAGE = ('<div class="match-header"><div class="wf-title-med">A</div>'
+              '<div class="wf-title-med">B</div></div><div class="match-header-event">Event</div>')
+
+
+def results_page(match_ids):
+    links = ''.join(f'<a class="wf-module-item match-item" href="/{i}/a-vs-b">A vs B</a>' for i in match_ids)
+    return 200, f'<html><body>{links}</body></html>'
+
+
+def add_results(server, pages):
+    for page, match_ids in enumerate(pages, 1):
+        path = "/matches/results" if page == 1 else f"/matches/results/?page={page}"
+        server.routes[path] = results_page(match_ids)
+        for match_id in match_ids:
+            server.routes.setdefault(f"/{match_id}/a-vs-b", (200, MATCH_PAGE))
+    server.routes[f"/matches/results/?page={len(pages) + 1}"] = results_page([])
+
+
+def make_crawler(server, tmp_path, **kwargs):
+    return MatchCrawler(
+        scraper=VLRScraper(base_url=server.url),
+        state_path=str(tmp_path / "state.json"),
+        output_path=str(tmp_path / "matches.jsonl"),
+        requests_per_minute=60000,
+        workers=2,
+        **kwargs
+    )
+
+
+def read_output(tmp_path):
+    with open(tmp_path / "matches.jsonl", encoding='utf-8') as file:
+        return [json.loads(line)['match_id'] for line in file]
+
+
+def test_crawl_paginates_dedups_and_resumes(fixture_server, tmp_path):
+    # Page 2 repeats match 4, as happens when new results shift the listing
+    add_results(fixture_server, [[1, 2, 3, 4], [4, 5, 6, 7], [8, 9]])
+    fixture_server.routes["/6/a-vs-b"] = [(500, ''), (200, MATCH_PAGE)]
+
+    summary = make_crawler(fixture_server, tmp_path, max_pages=2).run()
+    assert summary == {'pages': 2, 'seen': 6, 'failed': 1, 'exhausted': False}
+    assert sorted(read_output(tmp_path), key=int) == ['1', '2', '3', '4', '5', '7']
+
+    summary = make_crawler(fixture_server, tmp_path).run()
+    assert summary == {'pages': 1, 'seen': 9, 'failed': 0, 'exhausted': True}
+    assert sorted(read_output(tmp_path), key=int) == [str(i) for i in range(1, 10)]
+
+    # Every match fetched once, apart from the retry of the failed one
+    detail_requests = [path for path in fixture_server.requests if path.endswith('/a-vs-b')]
+    assert len(detail_requests) == 10
+    assert detail_requests.count("/6/a-vs-b") == 2
+    # Resumed from page 3 instead of starting over
+    assert fixture_server.requests.count("/matches/results") == 1
+
+
+def test_failed_matches_stop_after_max_retries(fixture_server, tmp_path):
+    add_results(fixture_server, [[1, 2]])
+    fixture_server.routes["/2/a-vs-b"] = (500, '')
+
+    assert make_crawler(fixture_server, tmp_path, max_retries=2).run()['failed'] == 1
+    assert make_crawler(fixture_server, tmp_path, max_retries=2).run()['failed'] == 1
+    assert make_crawler(fixture_server, tmp_path, max_retries=2).run()['failed'] == 1
+
+    assert fixture_server.requests.count("/2/a-vs-b") == 2
+    assert read_output(tmp_path) == ['1']
+
+
+def test_resume_drops_half_written_record(fixture_server, tmp_path):
+    add_results(fixture_server, [[1, 2], [3, 4]])
+    make_crawler(fixture_server, tmp_path, max_pages=1).run()
+
+    # Killed in the middle of writing a record
+    with open(tmp_path / "matches.jsonl", 'a', encoding='utf-8') as file:
+        file.write('{"team1": "A", "match_id": "9')
+
+    make_crawler(fixture_server, tmp_path).run()
+
+    assert sorted(read_output(tmp_path), key=int) == ['1', '2', '3', '4']
@@ -0,0 +1,140 @@
+import pytest
+import requests
+
+from vlr_scraper import CSVMapper, EventTeamsParser, StatsTableParser, VLRScraper
+
+
+def stats_row(player_id, slug, name):
+    return (f'<tr><td class="mod-player mod-a"><a href="/player/{player_id}/{slug}">'
+            f'<div class="text-of" style="font-weight: 700;">{name}</div>'
+            '<div class="stats-player-country">TEAM</div></a></td><td>1.0</td></tr>')
+
+
+def test_stream_page_defaults_to_utf8_without_charset(fixture_server):
+    fixture_server.content_type = 'text/html'
+    fixture_server.routes["/stats"] = (200, f'<table>{stats_row(1, "sokor", "Sökör")}</table>')
+    scraper = VLRScraper(base_url=fixture_server.url)
+
+    records = list(scraper.stream_page(fixture_server.url + "/stats", StatsTableParser()))
+
+    assert records == [{"id": "1", "slug": "sokor", "name": "Sökör"}]
+    assert scraper.get_page(fixture_server.url + "/stats").find('div').get_text() == "Sökör"
+
+
+def test_stream_page_raises_on_truncated_body(fixture_server):
+    body = f'<table>{stats_row(1, "a", "A")}{stats_row(2, "b", "B")}</table>'
+    fixture_server.routes["/stats"] = (200, body, len(body) + 1000)
+    scraper = VLRScraper(base_url=fixture_server.url)
+
+    with pytest.raises(requests.RequestException):
+        list(scraper.stream_page(fixture_server.url + "/stats", StatsTableParser()))
+
+
+def test_team_details_skips_failing_roster_player(fixture_server, monkeypatch):
+    items = ''.join(
+        f'<div class="team-roster-item"><a href="/player/{i}/p{i}">'
+        f'<div class="team-roster-item-name-alias">p{i}</div></a></div>'
+        for i in (1, 2, 3)
+    )
+    fixture_server.routes["/team/1/t"] = (200, (
+        '<h1 class="wf-title">Team</h1>'
+        '<div class="wf-card" style="overflow: hidden; padding: 18px 20px;">'
+        f'<div class="wf-module-label">players</div><div>{items}</div></div>'
+    ))
+    scraper = VLRScraper(base_url=fixture_server.url)
+
+    def get_player(vlr_id, slug=None):
+        if vlr_id == 2:
+            raise IndexError("list index out of range")
+        return {'vlr_id': vlr_id}
+    monkeypatch.setattr(scraper, 'get_player', get_player)
+
+    team = scraper.get_team_details(fixture_server.url + "/team/1/t")
+
+    assert [player['vlr_id'] for player in team['roster']['players']] == [1, 3]
+
+
+def profile_page(ign):
+    return 200, f'<html><h1 class="wf-title">{ign}</h1><h2 class="player-real-name">Real Name</h2></html>'
+
+
+def test_index_reload_leaves_partial_row_for_next_reload(tmp_path):
+    path = tmp_path / "index.csv"
+    path.write_bytes(b'Player ID,Player Name\r\n1,a\r\n2,xy')
+    index = CSVMapper(str(path))
+    assert index.get_string(1) == 'a'
+    assert index.get_string(2) is None
+
+    with open(path, 'ab') as file:
+        file.write(b'zzy\r\n')
+    index.reload()
+
+    assert index.get_string(2) == 'xyzzy'
+    assert index.get_integer('xy') is None
+
+
+def test_index_add_is_seen_by_other_readers(tmp_path):
+    path = tmp_path / "data" / "index.csv"
+    writer = CSVMapper(str(path))
+    reader = CSVMapper(str(path))
+    assert writer.get_string(1) is None
+
+    writer.add(1, 'a')
+    writer.add(2, 'Comma, Name')
+    reader.reload()
+
+    assert reader.get_string(1) == 'a'
+    assert reader.get_string(2) == 'Comma, Name'
+    assert path.read_bytes().startswith(b'Player ID,Player Name\r\n')
+    assert CSVMapper(str(path)).int_to_string == {1: 'a', 2: 'Comma, Name'}
+
+
+def test_get_player_resolves_unknown_ids_and_learns_them(fixture_server, tmp_path):
+    fixture_server.routes["/player/5/new-slug"] = profile_page("NewSlug")
+    fixture_server.routes["/player/5/NewSlug"] = profile_page("NewSlug")
+    fixture_server.routes["/player/6"] = profile_page("IdOnly")
+    scraper = VLRScraper(base_url=fixture_server.url)
+    scraper._player_index = CSVMapper(str(tmp_path / "index.csv"))
+
+    assert scraper.get_player(5, slug='new-slug')['ign'] == "NewSlug"
+    assert scraper.get_player(6)['ign'] == "IdOnly"
+    assert scraper.get_player(5)['url'] == fixture_server.url + "/player/5/NewSlug"
+
+    learned = CSVMapper(str(tmp_path / "index.csv"))
+    assert learned.get_string(5) == "NewSlug"
+    assert learned.get_string(6) == "IdOnly"
+
+
+def test_get_player_survives_read_only_index(fixture_server, tmp_path, monkeypatch):
+    fixture_server.routes["/player/6"] = profile_page("IdOnly")
+    scraper = VLRScraper(base_url=fixture_server.url)
+    scraper._player_index = CSVMapper(str(tmp_path / "index.csv"))
+
+    def add(integer_key, string_key):
+        raise PermissionError("read-only file system")
+    monkeypatch.setattr(scraper._player_index, 'add', add)
+
+    assert scraper.get_player(6)['ign'] == "IdOnly"
+
+
+def test_event_teams_parser_only_reads_teams_container():
+    parser = EventTeamsParser()
+    parser.feed(
+        '<a class="event-team-name" href="/team/9/outside">Outside</a>'
+        '<div class="event-teams-container"><div class="event-team">'
+        '<a class="event-team-name" href="/team/1/a">A</a></div>'
+        '<div class="event-team"><a class="event-team-name" href="/team/2/b">B</a></div></div>'
+        '<div><a class="event-team-name" href="/team/8/after">After</a></div>'
+    )
+    parser.close()
+
+    assert parser.found_container
+    assert parser.records == ["/team/1/a", "/team/2/b"]
+
+
+def test_event_teams_parser_reports_missing_container():
+    parser = EventTeamsParser()
+    parser.feed('<div><a class="event-team-name" href="/team/1/a">A</a></div>')
+
+    assert not parser.found_container
+    assert parser.records == []
@@ -0,0 +1,223 @@
+import argparse
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from requests.adapters import HTTPAdapter
+
+from vlr_scraper import VLRScraper
+
+
+class RateLimiter:
+    """
+    Spaces request starts evenly so the crawl never exceeds a fixed budget.
+    Shared by all worker threads.
+    """
+    def __init__(self, requests_per_minute):
+        self.interval = 60.0 / requests_per_minute
+        self.lock = threading.Lock()
+        self.next_slot = time.monotonic()
+
+    def wait(self):
+        """Block until the caller is allowed to start its next request"""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_slot, now)
+            self.next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class MatchCrawler:
+    """
+    Resumable backfill of match history from /matches/results.
+
+    Result pages are walked in order and every match found is pushed onto a
+    frontier. Match details are fetched concurrently from the frontier and
+    appended to a JSON lines file. The frontier, the seen-set and the next
+    results page are checkpointed to a JSON state file, so an interrupted
+    crawl picks up where it left off. Matches whose details could not be
+    fetched are queued again on the next run, up to max_retries attempts.
+    """
+    def __init__(self, scraper=None, state_path="crawl_state.json", output_path="matches.jsonl",
+                 requests_per_minute=60, workers=4, max_pages=None, max_retries=3):
+        self.scraper = scraper or VLRScraper()
+        self.state_path = state_path
+        self.output_path = output_path
+        self.workers = workers
+        self.max_pages = max_pages
+        self.max_retries = max_retries
+        self.limiter = RateLimiter(requests_per_minute)
+
+        # Keep one pooled connection per worker instead of reconnecting
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+        self.scraper.session.mount('http://', adapter)
+        self.scraper.session.mount('https://', adapter)
+
+        self.state = self._load_state()
+
+    def _load_state(self):
+        state = {'next_page': 1, 'exhausted': False, 'frontier': [], 'seen': [], 'failed': []}
+        if os.path.exists(self.state_path):
+            with open(self.state_path, 'r', encoding='utf-8') as file:
+                state.update(json.load(file))
+
+        self.seen = set(state['seen'])
+        self._repair_output()
+
+        # Records written after the last checkpoint still count as fetched
+        if os.path.exists(self.output_path):
+            with open(self.output_path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    try:
+                        self.seen.add(json.loads(line)['match_id'])
+                    except (ValueError, KeyError):
+                        continue
+
+        state['frontier'] = [item for item in state['frontier'] if item['match_id'] not in self.seen]
+
+        # Give matches that failed on a previous run another attempt
+        retry = [item for item in state['failed']
+                 if item['match_id'] not in self.seen and item.get('attempts', 0) < self.max_retries]
+        state['failed'] = [item for item in state['failed'] if item not in retry]
+        state['frontier'].extend(retry)
+        return state
+
+    def _repair_output(self):
+        """
+        Cut a record that was half-written when the previous run was killed,
+        so the next record is not appended onto the broken line. That match
+        is not in the seen-set yet and gets fetched again.
+        """
+        if not os.path.exists(self.output_path):
+            return
+        with open(self.output_path, 'rb+') as file:
+            end = file.seek(0, os.SEEK_END)
+            position = end
+            # Walk back from the end to the last newline
+            while position > 0:
+                start = max(position - 65536, 0)
+                file.seek(start)
+                chunk = file.read(position - start)
+                newline = chunk.rfind(b'\n')
+                if newline != -1:
+                    position = start + newline + 1
+                    break
+                position = start
+            if position < end:
+                file.truncate(position)
+
+    def checkpoint(self):
+        """Atomically write the crawl state to disk"""
+        self.state['seen'] = sorted(self.seen, key=int)
+        tmp_path = self.state_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(self.state, file)
+        os.replace(tmp_path, self.state_path)
+
+    def _fetch_details(self, item):
+        self.limiter.wait()
+        details = self.scraper.get_match_details(item['url'])
+        if details is None:
+            return None
+        details['match_id'] = item['match_id']
+        details['url'] = item['url']
+        return details
+
+    def _drain_frontier(self, output):
+        """Fetch details for everything currently on the frontier"""
+        batch_size = self.workers * 4
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while self.state['frontier']:
+                batch = self.state['frontier'][:batch_size]
+                for item, details in zip(batch, executor.map(self._fetch_details, batch)):
+                    if details is None:
+                        # Not marked seen, so a later run can retry it
+                        item['attempts'] = item.get('attempts', 0) + 1
+                        self.state['failed'].append(item)
+                    else:
+                        output.write(json.dumps(details) + "\n")
+                        self.seen.add(item['match_id'])
+                output.flush()
+                del self.state['frontier'][:len(batch)]
+                self.checkpoint()
+
+    def _expand_frontier(self):
+        """Queue unseen matches from the next results page. Returns False when the crawl should stop."""
+        page = self.state['next_page']
+        self.limiter.wait()
+        results = self.scraper.get_match_results(page)
+        if results is None:
+            print(f"Stopping at results page {page}, will resume from here")
+            return False
+        if not results:
+            self.state['exhausted'] = True
+            self.checkpoint()
+            return False
+
+        queued = {item['match_id'] for item in self.state['frontier'] + self.state['failed']}
+        for item in results:
+            if item['match_id'] not in self.seen and item['match_id'] not in queued:
+                self.state['frontier'].append(item)
+                queued.add(item['match_id'])
+
+        self.state['next_page'] = page + 1
+        self.checkpoint()
+        return True
+
+    def run(self):
+        """Crawl until the results pages run out, max_pages is reached, or a page fails"""
+        start = time.monotonic()
+        pages = 0
+
+        with open(self.output_path, 'a', encoding='utf-8') as output:
+            # Finish whatever was queued when the previous run stopped
+            self._drain_frontier(output)
+
+            while not self.state['exhausted']:
+                if self.max_pages is not None and pages >= self.max_pages:
+                    break
+                if not self._expand_frontier():
+                    break
+                pages += 1
+                self._drain_frontier(output)
+
+                elapsed = time.monotonic() - start
+                print(f"Page {self.state['next_page'] - 1} done, "
+                      f"{len(self.seen)} matches seen, {pages * 60 / elapsed:.1f} pages/min")
+
+        return {
+            'pages': pages,
+            'seen': len(self.seen),
+            'failed': len(self.state['failed']),
+            'exhausted': self.state['exhausted']
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill VLR match history")
+    parser.add_argument('--base-url', default="https://www.vlr.gg")
+    parser.add_argument('--state', default="crawl_state.json")
+    parser.add_argument('--output', default="matches.jsonl")
+    parser.add_argument('--rpm', type=float, default=60, help="request budget per minute")
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--max-pages', type=int, default=None)
+    parser.add_argument('--max-retries', type=int, default=3, help="attempts per match across runs")
+    args = parser.parse_args()
+
+    crawler = MatchCrawler(
+        scraper=VLRScraper(base_url=args.base_url),
+        state_path=args.state,
+        output_path=args.output,
+        requests_per_minute=args.rpm,
+        workers=args.workers,
+        max_pages=args.max_pages,
+        max_retries=args.max_retries
+    )
+    print(json.dumps(crawler.run(), indent=2))
+
+if __name__ == "__main__":
+    main()
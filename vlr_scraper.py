@@ -1,42 +1,104 @@
 import sys
 import re
-import requests
-from bs4 import BeautifulSoup
 import time
 import random
 import json
 from datetime import datetime
 import os
 import csv
+import codecs
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+
+# requests and bs4 are imported on first use so that importing this module
+# (and starting the API) stays cheap; warm_up() pays for them ahead of traffic.
+
+# Player ID <-> IGN index, overridable for deployments that keep data elsewhere
+PLAYER_INDEX_PATH = os.environ.get(
+      "VLR_PLAYER_INDEX",
+      os.path.join(os.path.dirname(os.path.abspath(__file__)), "resources", "vlr_playerid_playerign.csv")
+)
 
 # Bidirectional mapper class for efficient lookups
 class CSVMapper:
       """
       Bidirectional mapper for CSV files with integer-string pairs.
+      The file is treated as append-only: new pairs are appended with add(),
+      and reload() only reads what other writers appended since the last read.
+      A missing file is an empty index; add() creates it.
       """
-      def __init__(self):
-          
+      def __init__(self, csv_file_path=None):
+          self.csv_file_path = csv_file_path or PLAYER_INDEX_PATH
           self.int_to_string = {}
           self.string_to_int = {}
-          self._load_csv("/home/alanwsl/projects/val-api/resources/vlr_playerid_playerign.csv")
+          self._offset = 0
+          self._lock = threading.Lock()
+          self._load_csv(self.csv_file_path)
 
       def _load_csv(self, csv_file_path):
           if not os.path.exists(csv_file_path):
-              raise FileNotFoundError(f"CSV file not found: {csv_file_path}")
-
-          with open(csv_file_path, 'r', encoding='utf-8') as file:
-              reader = csv.reader(file)
-              next(reader)  # Skip header row
-
-              for row in reader:
-                  if len(row) >= 2:
-                      try:
-                          key = int(row[0])
-                          value = row[1].strip()
-                          self.int_to_string[key] = value
-                          self.string_to_int[value] = key
-                      except ValueError:
-                          continue
+              return
+
+          with open(csv_file_path, 'rb') as file:
+              file.seek(self._offset)
+              data = file.read()
+
+          # A row after the last newline may still be in the middle of being
+          # written, so it is left for the next reload
+          complete = data.rfind(b'\n') + 1
+          lines = data[:complete].decode('utf-8', errors='replace').splitlines()
+          if self._offset == 0:
+              lines = lines[1:]  # Skip header row
+          self._offset += complete
+
+          for row in csv.reader(lines):
+              if len(row) >= 2:
+                  try:
+                      key = int(row[0])
+                      value = row[1].strip()
+                      self.int_to_string[key] = value
+                      self.string_to_int[value] = key
+                  except ValueError:
+                      continue
+
+      def reload(self):
+          """Pick up rows appended to the CSV since it was last read"""
+          with self._lock:
+              if not os.path.exists(self.csv_file_path):
+                  return
+              if os.path.getsize(self.csv_file_path) < self._offset:
+                  # File was replaced rather than appended to, start over
+                  self._offset = 0
+              self._load_csv(self.csv_file_path)
+
+      def add(self, integer_key, string_key):
+          """Append a new pair to the CSV and the in-memory maps"""
+          with self._lock:
+              if self.int_to_string.get(integer_key) == string_key:
+                  return
+
+              line = io.StringIO()
+              csv.writer(line, lineterminator='\r\n').writerow([integer_key, string_key])
+              line = line.getvalue()
+
+              directory = os.path.dirname(self.csv_file_path)
+              if directory:
+                  os.makedirs(directory, exist_ok=True)
+
+              with open(self.csv_file_path, 'a+b') as file:
+                  file.seek(0, os.SEEK_END)
+                  if file.tell() == 0:
+                      line = 'Player ID,Player Name\r\n' + line
+                  else:
+                      file.seek(-1, os.SEEK_END)
+                      if file.read(1) != b'\n':
+                          line = '\r\n' + line
+                  file.write(line.encode('utf-8'))
+
+              self.int_to_string[integer_key] = string_key
+              self.string_to_int[string_key] = integer_key
 
       def get_string(self, integer_key):
           """Get string by integer key"""
@@ -45,12 +107,101 @@ class CSVMapper:
       def get_integer(self, string_key):
           """Get integer by string key"""
           return self.string_to_int.get(string_key)
-      
 
-class VLRScraper:
+
+class StatsTableParser(HTMLParser):
+    """
+    Event-based extractor for event stats tables.
+    Emits one {"id", "slug", "name"} record per player row as the HTML is fed in,
+    without building a document tree.
+    """
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.in_player_cell = False
+        self.player_id = None
+        self.player_slug = None
+        self.name_depth = 0
+        self.name_parts = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get('class') or '').split()
+
+        if tag == 'td' and 'mod-player' in classes and 'mod-a' in classes:
+            self.in_player_cell = True
+            self.player_id = None
+        elif not self.in_player_cell:
+            return
+        elif tag == 'a' and self.player_id is None:
+            # Extract ID from URL like "/player/36245/n4rrate"
+            href = attrs.get('href') or ''
+            if '/player/' in href:
+                parts = href.split('/player/')[1].split('/')
+                self.player_id = parts[0]
+                self.player_slug = parts[1] if len(parts) > 1 and parts[1] else None
+        elif tag == 'div' and self.player_id is not None:
+            if self.name_depth:
+                self.name_depth += 1
+            elif 'font-weight: 700' in (attrs.get('style') or ''):
+                self.name_depth = 1
+                self.name_parts = []
+
+    def handle_endtag(self, tag):
+        if not self.in_player_cell:
+            return
+        if tag == 'div' and self.name_depth:
+            self.name_depth -= 1
+            if not self.name_depth:
+                player_name = ''.join(self.name_parts).strip()
+                if player_name:
+                    self.records.append({"id": self.player_id, "slug": self.player_slug, "name": player_name})
+                self.player_id = None
+        elif tag == 'td':
+            self.in_player_cell = False
+            self.name_depth = 0
+
+    def handle_data(self, data):
+        if self.name_depth:
+            self.name_parts.append(data)
+
+
+class EventTeamsParser(HTMLParser):
+    """
+    Event-based extractor for event team listings.
+    Emits the relative URL of every team linked from the event teams container.
+    """
     def __init__(self):
-        self.base_url = "https://www.vlr.gg"
-        self.session = requests.Session()
+        super().__init__()
+        self.records = []
+        self.found_container = False
+        self.container_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get('class') or '').split()
+
+        if tag == 'div':
+            if self.container_depth:
+                self.container_depth += 1
+            elif 'event-teams-container' in classes:
+                self.found_container = True
+                self.container_depth = 1
+        elif tag == 'a' and self.container_depth:
+            if 'event-team-name' in classes and attrs.get('href'):
+                self.records.append(attrs['href'])
+
+    def handle_endtag(self, tag):
+        if tag == 'div' and self.container_depth:
+            self.container_depth -= 1
+
+
+class VLRScraper:
+    def __init__(self, base_url="https://www.vlr.gg"):
+        self.base_url = base_url.rstrip('/')
+        self._session = None
+        self._player_index = None
+        self._lock = threading.Lock()
         
         # Simple user agents pool
         self.user_agents = [
@@ -59,24 +210,120 @@ class VLRScraper:
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0"
         ]
     
-    def get_page(self, url):
-        """Fetch a web page with browser-like headers"""
-        headers = {
+    @property
+    def session(self):
+        """Shared HTTP session, created on first use"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    import requests
+                    self._session = requests.Session()
+        return self._session
+    
+    @property
+    def player_index(self):
+        """Player ID <-> IGN mapping, loaded once on first use"""
+        if self._player_index is None:
+            with self._lock:
+                if self._player_index is None:
+                    self._player_index = CSVMapper()
+        return self._player_index
+    
+    def warm_up(self, connections=4):
+        """
+        Pay the cold start costs before serving traffic: import the parsing
+        stack, load the player index and open pooled keep-alive connections
+        (including the TLS handshake) to the base URL.
+        Connection warm-up is best-effort; returns how many were opened.
+        """
+        from bs4 import BeautifulSoup
+        from requests.adapters import HTTPAdapter
+        
+        self.player_index  # loads the CSV on first access
+        
+        if connections <= 0:
+            return 0
+        adapter = HTTPAdapter(pool_maxsize=max(connections, 10))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Concurrent requests so each one checks a separate connection into the pool
+        def open_connection(_):
+            try:
+                self.session.head(self.base_url, headers=self._headers(), timeout=10)
+                return True
+            except Exception as e:
+                print(f"Error warming connection to {self.base_url}: {e}")
+                return False
+        
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            return sum(executor.map(open_connection, range(connections)))
+    
+    def _headers(self):
+        """Browser-like request headers"""
+        return {
             'User-Agent': random.choice(self.user_agents),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Accept-Encoding': 'gzip, deflate',
             'Connection': 'keep-alive',
         }
+    
+    def get_page(self, url):
+        """Fetch a web page with browser-like headers"""
+        import requests
+        from bs4 import BeautifulSoup
         
         try:
-            response = self.session.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=self._headers(), timeout=10)
             response.raise_for_status()
             return BeautifulSoup(response.content, 'html.parser')
         except requests.RequestException as e:
             print(f"Error fetching {url}: {e}")
             return None
     
+    def stream_page(self, url, parser, chunk_size=16384):
+        """
+        Fetch a web page and feed its body to an event-based parser as it arrives.
+        Returns a generator of the parser's records, or None if the request failed.
+        The generator raises requests.RequestException if the body is cut off,
+        so a truncated page is never mistaken for a complete one.
+        """
+        import requests
+        
+        try:
+            response = self.session.get(url, headers=self._headers(), timeout=10, stream=True)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"Error fetching {url}: {e}")
+            return None
+        
+        # requests falls back to ISO-8859-1 when Content-Type names no charset;
+        # VLR serves UTF-8, so only trust an explicit charset
+        if 'charset' in response.headers.get('content-type', '').lower():
+            encoding = response.encoding
+        else:
+            encoding = 'utf-8'
+        
+        def records():
+            decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+            try:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    parser.feed(decoder.decode(chunk))
+                    yield from parser.records
+                    parser.records.clear()
+                parser.feed(decoder.decode(b'', final=True))
+                parser.close()
+                yield from parser.records
+                parser.records.clear()
+            except requests.RequestException as e:
+                print(f"Error reading {url}: {e}")
+                raise
+            finally:
+                response.close()
+        
+        return records()
+    
     def get_matches(self):
         """Scrape matches from VLR matches page"""
         url = f"{self.base_url}/matches"
@@ -131,8 +378,37 @@ class VLRScraper:
                 print(f"Error parsing match: {e}")
                 continue
         
+        # Free the parse tree now rather than when the caller lets go of it
+        soup.decompose()
         return matches
     
+    def get_match_results(self, page=1):
+        """Scrape one page of completed matches from VLR results page"""
+        url = f"{self.base_url}/matches/results"
+        if page > 1:
+            url = f"{url}/?page={page}"
+        soup = self.get_page(url)
+        
+        if not soup:
+            return None
+        
+        results = []
+        
+        # Each completed match is an <a class="match-item"> linking to "/<id>/<slug>"
+        for match_link in soup.find_all('a', class_='match-item', href=True):
+            href = match_link['href']
+            parts = href.strip('/').split('/')
+            if not parts or not parts[0].isdigit():
+                continue
+            
+            results.append({
+                'match_id': parts[0],
+                'url': self.base_url + href
+            })
+        
+        soup.decompose()
+        return results
+    
     def get_match_details(self, match_url):
         """Get detailed information about a specific match"""
         soup = self.get_page(match_url)
@@ -177,6 +453,7 @@ class VLRScraper:
         except Exception as e:
             print(f"Error parsing match details: {e}")
         
+        soup.decompose()
         return match_details
     
     
@@ -184,75 +461,56 @@ class VLRScraper:
         """Scrape players from VLR event stats page"""
         match region.lower():
             case 'americas':
-                url = "https://www.vlr.gg/event/stats/2501/vct-2025-americas-stage-2"
+                url = f"{self.base_url}/event/stats/2501/vct-2025-americas-stage-2"
             case 'emea':
-                url = "https://www.vlr.gg/event/stats/2498/vct-2025-emea-stage-2"
+                url = f"{self.base_url}/event/stats/2498/vct-2025-emea-stage-2"
             case 'apac':
-                url = "https://www.vlr.gg/event/stats/2500/vct-2025-pacific-stage-2"
+                url = f"{self.base_url}/event/stats/2500/vct-2025-pacific-stage-2"
             case 'china':
-                url = "https://www.vlr.gg/event/stats/2499/vct-2025-china-stage-2"
+                url = f"{self.base_url}/event/stats/2499/vct-2025-china-stage-2"
             case _:
                 return None
         
-        soup = self.get_page(url)
-        if not soup:
+        # Stream the stats table row by row instead of holding the whole page tree
+        import requests
+        
+        records = self.stream_page(url, StatsTableParser())
+        if records is None:
+            return None
+        try:
+            players = list(records)
+        except requests.RequestException:
             return None
-            
-        # Add player scraping logic here
-        player_rows = soup.find_all('tr')
-        players = []   
-        for row in player_rows:
-        # Find the player cell
-            player_cell = row.find('td', class_='mod-player mod-a')
-
-            if player_cell:
-                # Extract the player link
-                player_link = player_cell.find('a')
-
-                if player_link:
-                    # Get the href attribute and extract player ID
-                    href = player_link.get('href')
-                    if href and '/player/' in href:
-                        # Extract ID from URL like "/player/36245/n4rrate"
-                        player_id = href.split('/player/')[1].split('/')[0]
-
-                        # Get player name from the div with font-weight: 700
-                        name_div = player_link.find('div', style=lambda x: x and 'font-weight: 700' in x)
-                        if name_div:
-                            player_name = name_div.text.strip()
-
-                            players.append({
-                                "id": player_id,
-                                "name": player_name
-                            })
 
         # Sort alphabetically by in-game name (case insensitive)
         sorted_players = sorted(players, key=lambda x: x["name"].upper())
-
-        # Print the results
-        for i, player in enumerate(sorted_players, 1):
-            players.append({
-                "id": player["id"],
-                "name": player["name"]
-            })
         
         full_players_list = []
         for player in sorted_players:
             player_id = int(player['id'])
-            player_details = self.get_player(player_id)
+            player_details = self.get_player(player_id, slug=player['slug'])
             if player_details:
-                full_players_list.extend(player_details)
+                full_players_list.append(player_details)
         return full_players_list
     
     
-    def get_player(self, vlr_id):
-        """Get detailed information about a specific player"""
-        csvmap = CSVMapper()
-        player_ign = csvmap.get_string(vlr_id)
-        if not player_ign:
-            print(f"Player IGN '{player_ign}' not found in CSV mapping.")
-            return None 
-        url = f"{self.base_url}/player/{vlr_id}/{player_ign}"
+    def get_player(self, vlr_id, slug=None):
+        """
+        Get detailed information about a specific player.
+        Players missing from the index are fetched by the slug from the link
+        they were found through, or by the id-only profile URL, and learned.
+        """
+        known_ign = self.player_index.get_string(vlr_id)
+        if not known_ign:
+            # Another worker may have learned this player since we loaded the index
+            self.player_index.reload()
+            known_ign = self.player_index.get_string(vlr_id)
+        
+        path_ign = known_ign or slug
+        if path_ign:
+            url = f"{self.base_url}/player/{vlr_id}/{path_ign}"
+        else:
+            url = f"{self.base_url}/player/{vlr_id}"
         soup = self.get_page(url)
 
         if not soup: 
@@ -318,6 +576,15 @@ class VLRScraper:
         else:
             country = "Unknown"
 
+        soup.decompose()
+
+        # Learn the mapping so the next lookup is a plain index hit
+        if not known_ign and player_ign != "Unknown Player":
+            try:
+                self.player_index.add(vlr_id, player_ign)
+            except OSError as e:
+                print(f"Error adding player {vlr_id} to index: {e}")
+
         player_details = {
             'vlr_id': vlr_id,
             'ign': player_ign,
@@ -335,10 +602,10 @@ class VLRScraper:
     def get_teams(self, region):
         """Scrape teams based on region"""
 
-        url_list = ["https://www.vlr.gg/event/2501/vct-2025-americas-stage-2/group-stage", 
-                    "https://www.vlr.gg/event/2498/vct-2025-emea-stage-2/group-stage",
-                    "https://www.vlr.gg/event/2500/vct-2025-pacific-stage-2/group-stage",
-                    "https://www.vlr.gg/event/2499/vct-2025-china-stage-2/group-stage"]
+        url_list = [f"{self.base_url}/event/2501/vct-2025-americas-stage-2/group-stage", 
+                    f"{self.base_url}/event/2498/vct-2025-emea-stage-2/group-stage",
+                    f"{self.base_url}/event/2500/vct-2025-pacific-stage-2/group-stage",
+                    f"{self.base_url}/event/2499/vct-2025-china-stage-2/group-stage"]
 
         match region.lower():
             case 'americas':
@@ -355,48 +622,34 @@ class VLRScraper:
             case _:
                 return None
         
-        soup = self.get_page(url)
-        if not soup:
-            return None
-        
-        teams = []
-        
-        
-        team_table = soup.find('div', class_="event-teams-container")
-        if not team_table:
-            return None
+        import requests
         
-        try:
-            team_rows = team_table.find_all('div', class_='event-team')
-            for row in team_rows:
-                try:
-                    
-                    team_name_div = row.find('a', class_='event-team-name')
-                    team_link_relative = team_name_div.get('href') if team_name_div else None
-                    team_link_absolute = self.base_url + team_link_relative if team_link_relative else None
-                    team_details = self.get_team_details(team_link_absolute) if team_link_absolute else None
-                    team_details['region'] = region.lower()
-                    team_details['url'] = team_link_absolute
-
-                    teams.append(team_details)
-                
-                    
-                    
-                    # team_details = self.get_team_details(self.base_url + team_link['href'])
-                    
-                    
-                    
-                        
+        urls = url if isinstance(url, list) else [url]
+        team_links = []
+        for event_url in urls:
+            parser = EventTeamsParser()
+            records = self.stream_page(event_url, parser)
+            if records is None:
+                return None
+            try:
+                team_links.extend(records)
+            except requests.RequestException:
+                return None
+            if not parser.found_container:
+                return None
         
-                except Exception as e:
-                    print(f"Error parsing team row: {e}")
-                    continue
-            
+        teams = []
+        for team_link_relative in team_links:
+            try:
+                team_link_absolute = self.base_url + team_link_relative
+                team_details = self.get_team_details(team_link_absolute)
+                team_details['region'] = region.lower()
+                team_details['url'] = team_link_absolute
 
-        except Exception as e:
-            print(f"Error finding team rows: {e}")
-            return None 
-        
+                teams.append(team_details)
+            except Exception as e:
+                print(f"Error parsing team row: {e}")
+                continue
         
         return teams
 
@@ -409,6 +662,8 @@ class VLRScraper:
             return None
         
         team_details = {}
+        # Roster players are fetched after this page's tree is freed
+        pending_players = []
         
         try:
             # Team name
@@ -491,11 +746,7 @@ class VLRScraper:
                             
                             # Get detailed player info
                             if section_type == 'players':
-                                player_info = self.get_player(player_id)
-                                if player_info:
-                                    player_info['is_captain'] = is_captain
-                                    player_info['is_active'] = is_active
-                                    roster_data['players'].append(player_info)
+                                pending_players.append((player_id, parts[1], is_captain, is_active))
                             elif section_type == 'staff':
                                 # For staff, create basic info since get_player might not work
                                 person_data = {
@@ -538,6 +789,20 @@ class VLRScraper:
         except Exception as e:
             print(f"Error parsing team details: {e}")
         
+        soup.decompose()
+        
+        if 'roster' in team_details:
+            for player_id, slug, is_captain, is_active in pending_players:
+                try:
+                    player_info = self.get_player(player_id, slug=slug)
+                    if player_info:
+                        player_info['is_captain'] = is_captain
+                        player_info['is_active'] = is_active
+                        team_details['roster']['players'].append(player_info)
+                except Exception as e:
+                    print(f"Error parsing roster item: {e}")
+                    continue
+        
         return team_details
     
     def sleep(self):